@@ -6,6 +6,7 @@ from entsoe import EntsoePandasClient
 from EntsoeAPI.configs import Configs
 from EntsoeAPI.utils import create_empty_hourly_df, get_root_dir
 from EntsoeAPI.queries import get_query
+from EntsoeAPI.estimator import ESTIMATE_INDEX, estimate_query, get_empty_estimate
 from EntsoeAPI.exporters import export_data, export_xlsx_multisheet
 from EntsoeAPI.timeperiod import TimePeriod
 
@@ -52,6 +53,24 @@ class Dataset:
         #     for timeperiod in self.timeperiods
         # }
 
+    def estimate_requests(self) -> pd.DataFrame:
+        """Estimate the cost of requesting the data of this dataset, without calling the API.
+
+        :return: DataFrame indexed by timeperiod, query and basic query with the columns 'calls', 'rows' and 'bytes'
+        """
+
+        estimates = {}
+        for timeperiod, item in self.timeperiods.items():
+            start, end = item
+            for query in self.queries:
+                estimates[(timeperiod, query)] = estimate_query(
+                    configs=self.configs, start=start, end=end, query_name=query)
+
+        if not estimates:  # dataset without queries or timeperiods
+            return get_empty_estimate(ESTIMATE_INDEX[1:])
+
+        return pd.concat(estimates, names=ESTIMATE_INDEX[1:])
+
     def export(self):
 
         pages = {}
@@ -0,0 +1,233 @@
+"""Estimate the cost of queries (API calls, data rows, payload size and runtime) without calling the API.
+
+The query profiles are calibrated for Austria (AT): the number of time series per response and the time resolutions
+differ between countries, so rows and payload sizes are rough estimates for other country codes. The number of API
+calls follows the request splitting of entsoe-py and holds for any country code.
+
+The examples in this module can be checked with ``python -m doctest -v src/EntsoeAPI/estimator.py``.
+"""
+
+import math
+
+import pandas as pd
+
+from dataclasses import dataclass
+
+from entsoe.mappings import NEIGHBOURS
+from entsoe.misc import year_blocks
+
+from EntsoeAPI.configs import Configs
+from EntsoeAPI.queries import queries, complex_query_lists
+
+ENTSOE_RATE_LIMIT: int = 400  # maximum number of API calls per minute allowed by the ENTSO E transparency platform
+ENTSOE_RESPONSE_TIME: float = 2.0  # mean response time of a single API call in seconds
+
+# approximate sizes of the elements of a response XML document, used to estimate payload sizes
+BYTES_PER_DOCUMENT: int = 1000  # document header
+BYTES_PER_SERIES: int = 1500  # header of a single <TimeSeries> element
+BYTES_PER_POINT: int = 80  # single <Point> element (position and value)
+
+ESTIMATE_INDEX: list[str] = ['dataset', 'timeperiod', 'query', 'basic_query']  # index levels of a session estimate
+ESTIMATE_COLUMNS: list[str] = ['calls', 'rows', 'bytes']
+
+
+@dataclass
+class QueryProfile:
+    """Expected shape of the response of a basic query, used for estimating its cost."""
+    resolution: str  # time resolution of the returned data
+    series: int = 1  # number of time series returned by a single API call
+    per_neighbour: bool = False  # if True, one API call is made per neighbouring bidding zone
+    pad_days: int = 0  # number of days entsoe-py adds before and after the requested time period
+    documents_per_call: int | None = None  # page size of paged responses (one document per day), None if not paged
+
+
+# response profiles of the basic queries (calibrated for AT)
+query_profiles: dict[str, QueryProfile] = {
+    # entsoe-py widens the time period by one day on each side and pages through the daily documents
+    'day_ahead_prices': QueryProfile(resolution='15min', pad_days=1, documents_per_call=100),
+    'wind_and_solar_generation_forecast': QueryProfile(resolution='15min', series=2),
+    'generation': QueryProfile(resolution='15min', series=12),  # one series per production type
+    'load_forecast': QueryProfile(resolution='15min'),
+    'load': QueryProfile(resolution='15min'),
+    'scheduled_exchanges': QueryProfile(resolution='h', per_neighbour=True),
+    'crossborder_exchange': QueryProfile(resolution='h', per_neighbour=True),
+    'imports': QueryProfile(resolution='h', per_neighbour=True),  # entsoe-py requests the flow from each neighbour
+}
+
+
+def expand_query(query_name: str) -> list[str]:
+    """Expand a query into the basic queries it consists of.
+
+    >>> expand_query('historical')
+    ['load', 'generation', 'crossborder_exchange', 'day_ahead_prices']
+    >>> expand_query('imports')
+    ['imports']
+
+    :param str query_name: name of a basic or complex query
+    :return: names of basic queries (a basic query is returned as the only list element)
+    """
+
+    if query_name in complex_query_lists:
+        return [basic_query for name in complex_query_lists[query_name] for basic_query in expand_query(name)]
+    if query_name not in queries:
+        raise ValueError(f'Invalid query {query_name}.')
+    if query_name not in query_profiles:
+        raise ValueError(f'No query profile defined for query {query_name}.')
+
+    return [query_name]
+
+
+def get_padded_period(query_name: str, start: pd.Timestamp, end: pd.Timestamp) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Get the time period actually requested by entsoe-py for a basic query.
+
+    :param str query_name: name of a basic query
+    :param pd.Timestamp start: start datetime of requested time period
+    :param pd.Timestamp end: end datetime of requested time period
+    :return: start and end datetime, widened by the padding of the query profile
+    """
+
+    pad = pd.Timedelta(days=query_profiles[query_name].pad_days)
+    return start - pad, end + pad
+
+
+def count_calls(query_name: str, start: pd.Timestamp, end: pd.Timestamp, country_code: str) -> int:
+    """Count the API calls entsoe-py makes for a basic query.
+
+    Requests are split into one-year blocks. Paged responses are requested with increasing offsets until an empty page
+    is returned, which counts as a call as well. Exchange queries are made once per neighbouring bidding zone.
+
+    >>> count_calls('load', pd.Timestamp('2016-01-01'), pd.Timestamp('2017-01-01'), 'AT')
+    1
+    >>> count_calls('day_ahead_prices', pd.Timestamp('2016-01-01'), pd.Timestamp('2017-01-01'), 'AT')
+    7
+    >>> count_calls('day_ahead_prices', pd.Timestamp('2025-10-18'), pd.Timestamp('2025-10-19'), 'AT')
+    2
+    >>> count_calls('crossborder_exchange', pd.Timestamp('2016-01-01'), pd.Timestamp('2017-01-01'), 'AT')
+    6
+
+    :param str query_name: name of a basic query
+    :param pd.Timestamp start: start datetime of requested time period
+    :param pd.Timestamp end: end datetime of requested time period
+    :param str country_code: unique code of target country
+    :return: number of API calls
+    """
+
+    profile = query_profiles[query_name]
+    start, end = get_padded_period(query_name, start, end)
+
+    calls = 0
+    for block_start, block_end in year_blocks(start, end):
+        if profile.documents_per_call:
+            documents = math.ceil((block_end - block_start) / pd.Timedelta(days=1))
+            calls += math.ceil(documents / profile.documents_per_call) + 1  # last (empty) page ends the paging
+        else:
+            calls += 1
+
+    if profile.per_neighbour:
+        calls *= len(NEIGHBOURS[country_code])
+
+    return calls
+
+
+def estimate_query(configs: Configs, start: pd.Timestamp, end: pd.Timestamp, query_name: str) -> pd.DataFrame:
+    """Estimate the number of API calls, data rows and payload size of a query, without calling the API.
+
+    Rows are counted per value, i.e. a response with two time series of 96 time steps each amounts to 192 rows. Rows
+    cover the requested time period only, while the payload size also includes the padding requested by entsoe-py.
+
+    :param Configs configs: configurations
+    :param pd.Timestamp start: start datetime of requested time period
+    :param pd.Timestamp end: end datetime of requested time period
+    :param str query_name: name of a basic or complex query
+    :return: DataFrame with one row per basic query and the columns 'calls', 'rows' and 'bytes'
+    """
+
+    country_code = configs.general.country_code
+
+    estimates = {}
+    for basic_query in expand_query(query_name):
+        profile = query_profiles[basic_query]
+        padded_start, padded_end = get_padded_period(basic_query, start, end)
+        calls = count_calls(basic_query, start, end, country_code)
+        series = len(NEIGHBOURS[country_code]) * profile.series if profile.per_neighbour else profile.series
+        rows = series * len(pd.date_range(start=start, end=end, freq=profile.resolution, inclusive='left'))
+        points = series * len(pd.date_range(start=padded_start, end=padded_end, freq=profile.resolution,
+                                            inclusive='left'))  # data points transferred, including padding
+
+        estimate = estimates.setdefault(basic_query, dict.fromkeys(ESTIMATE_COLUMNS, 0))
+        estimate['calls'] += calls
+        estimate['rows'] += rows
+        estimate['bytes'] += calls * BYTES_PER_DOCUMENT + series * BYTES_PER_SERIES + points * BYTES_PER_POINT
+
+    return pd.DataFrame.from_dict(estimates, orient='index', columns=ESTIMATE_COLUMNS)
+
+
+def get_empty_estimate(names: list[str] = ESTIMATE_INDEX) -> pd.DataFrame:
+    """Create an estimate without entries, e.g. for a configuration file without datasets.
+
+    >>> get_empty_estimate().index.names
+    FrozenList(['dataset', 'timeperiod', 'query', 'basic_query'])
+
+    :param list[str] names: index levels, defaults to the index levels of a session estimate
+    :return: empty DataFrame with the given index levels and the columns of an estimate
+    """
+
+    index = pd.MultiIndex(levels=[[]] * len(names), codes=[[]] * len(names), names=names)
+    return pd.DataFrame(index=index, columns=ESTIMATE_COLUMNS, dtype=int)
+
+
+def validate_runtime_parameters(rate_limit: float, response_time: float) -> None:
+    """Check the parameters used for estimating the runtime.
+
+    :param float rate_limit: maximum number of API calls per minute
+    :param float response_time: mean response time of a single API call in seconds
+    """
+
+    if not rate_limit > 0:
+        raise ValueError(f'Invalid rate limit {rate_limit}, must be greater than 0.')
+    if not response_time >= 0:
+        raise ValueError(f'Invalid response time {response_time}, must not be negative.')
+
+
+def estimate_runtime(calls: int, rate_limit: float = ENTSOE_RATE_LIMIT,
+                     response_time: float = ENTSOE_RESPONSE_TIME) -> pd.Timedelta:
+    """Estimate the runtime of a number of API calls.
+
+    The calls are made one after another, so the runtime is limited either by the response time of the API or by the
+    rate limit, whichever is slower.
+
+    >>> estimate_runtime(231, rate_limit=400, response_time=0.5)
+    Timedelta('0 days 00:01:55.500000')
+
+    :param int calls: number of API calls
+    :param float rate_limit: maximum number of API calls per minute
+    :param float response_time: mean response time of a single API call in seconds
+    :return: expected runtime
+    """
+
+    validate_runtime_parameters(rate_limit, response_time)
+
+    return pd.Timedelta(seconds=max(calls / rate_limit * 60, calls * response_time))
+
+
+def print_estimate(estimate: pd.DataFrame, rate_limit: float = ENTSOE_RATE_LIMIT,
+                   response_time: float = ENTSOE_RESPONSE_TIME) -> None:
+    """Print a summary of an estimate per dataset and in total.
+
+    >>> print_estimate(get_empty_estimate())  # doctest: +NORMALIZE_WHITESPACE
+    Dry run estimate (rate limit: 400 calls/min, response time: 2.0 s/call):
+    Total: 0 calls, 0 rows, 0.0 MB, 0 days 00:00:00
+
+    :param pd.DataFrame estimate: estimate with a 'dataset' index level and the columns 'calls', 'rows' and 'bytes'
+    :param float rate_limit: maximum number of API calls per minute
+    :param float response_time: mean response time of a single API call in seconds
+    """
+
+    def format_line(row: pd.Series) -> str:
+        return (f'{int(row['calls'])} calls, {int(row['rows'])} rows, {row['bytes'] / 1e6:.1f} MB, '
+                f'{estimate_runtime(int(row['calls']), rate_limit, response_time)}')
+
+    print(f'Dry run estimate (rate limit: {rate_limit} calls/min, response time: {response_time} s/call):')
+    for name, row in estimate.groupby(level='dataset', sort=False).sum().iterrows():
+        print(f'\t{name}: {format_line(row)}')
+    print(f'Total: {format_line(estimate.sum())}')
@@ -116,34 +116,35 @@ def imports(
     return response
 
 
-def get_all_forecast_data(
-        client: EntsoePandasClient, configs: Configs, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
-    """Get all day ahead data for a specified time period."""
-
-    # combine multiple base queries
-    query_list = [
+# names of the basic queries combined by each complex query
+complex_query_lists: dict[str, list[str]] = {
+    'forecast': [
         'day_ahead_prices',
         'wind_and_solar_generation_forecast',
         'load',
         'scheduled_exchanges'
-    ]
+    ],
+    'historical': [
+        'load',
+        'generation',
+        'crossborder_exchange',
+        'day_ahead_prices'
+    ],
+}
 
-    return get_complex_query(client, configs, start, end, query_list)
+
+def get_all_forecast_data(
+        client: EntsoePandasClient, configs: Configs, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Get all day ahead data for a specified time period."""
+
+    return get_complex_query(client, configs, start, end, complex_query_lists['forecast'])
 
 
 def get_all_historical_data(
         client: EntsoePandasClient, configs: Configs, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
     """Get all historic data for a specified time period."""
 
-    # combine multiple base queries
-    query_list = [
-        'load',
-        'generation',
-        'crossborder_exchange',
-        'day_ahead_prices'
-    ]
-
-    return get_complex_query(client, configs, start, end, query_list)
+    return get_complex_query(client, configs, start, end, complex_query_lists['historical'])
 
 
 # basic queries
@@ -1,5 +1,7 @@
 import configparser
 
+import pandas as pd
+
 from dataclasses import fields
 
 from entsoe import EntsoePandasClient
@@ -9,6 +11,8 @@ from EntsoeAPI.utils import get_date_today, parse_optional_list
 from EntsoeAPI.paths import Paths
 from EntsoeAPI.configs import Configs, Runtime
 from EntsoeAPI.dataset import Dataset
+from EntsoeAPI.estimator import (ENTSOE_RATE_LIMIT, ENTSOE_RESPONSE_TIME, ESTIMATE_INDEX, get_empty_estimate,
+                                 print_estimate, validate_runtime_parameters)
 
 
 class Session:
@@ -29,8 +33,21 @@ class Session:
             date_today=get_date_today(timezone)  # today's date including time zone information
         )
 
-    def load_dataset_configs(self) -> None:
-        """Load dataset configurations from .ini file and create a Dataset object for each dataset."""
+    def load_dataset_configs(self, dry_run: bool = False, rate_limit: float = ENTSOE_RATE_LIMIT,
+                             response_time: float = ENTSOE_RESPONSE_TIME) -> pd.DataFrame | None:
+        """Load dataset configurations from .ini file and create a Dataset object for each dataset.
+
+        In dry run mode, every dataset is expanded into the basic API calls it consists of, and the expected number of
+        calls, data rows, payload size and runtime are printed. No data is requested from the API.
+
+        :param bool dry_run: if True, estimate the cost of requesting the data of all datasets
+        :param float rate_limit: maximum number of API calls per minute, used for estimating the runtime
+        :param float response_time: mean response time of a single API call in seconds, used for estimating the runtime
+        :return: estimate indexed by dataset, timeperiod, query and basic query (in dry run mode only)
+        """
+
+        if dry_run:
+            validate_runtime_parameters(rate_limit, response_time)  # before loading any dataset
 
         # initialize config parser
         config = configparser.ConfigParser()
@@ -56,6 +73,15 @@ class Session:
 
         self.datasets = datasets
 
+        if dry_run:
+            if datasets:
+                estimate = pd.concat({dataset.name: dataset.estimate_requests() for dataset in datasets},
+                                     names=ESTIMATE_INDEX[:1])
+            else:  # configuration file without any dataset section
+                estimate = get_empty_estimate()
+            print_estimate(estimate, rate_limit, response_time)
+            return estimate
+
 
 if __name__ == '__main__':
     from EntsoeAPI.utils import get_root_dir